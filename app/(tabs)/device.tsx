@@ -4,7 +4,7 @@ import { createDeviceStyles } from '@/styles/device.styles';
 import { supabase } from '@/utils/supabase';
 import { Ionicons } from '@expo/vector-icons';
 import * as IntentLauncher from 'expo-intent-launcher';
-import React, { useEffect, useRef, useState } from 'react';
+import React, { useEffect, useMemo, useRef, useState } from 'react';
 import { ActivityIndicator, Alert, Dimensions, FlatList, PermissionsAndroid, Platform, ScrollView, Text, TouchableOpacity, View } from 'react-native';
 import RNBluetoothClassic, { BluetoothDevice } from 'react-native-bluetooth-classic';
 import { SafeAreaView } from 'react-native-safe-area-context';
@@ -818,7 +818,7 @@ export default function DeviceScreen() {
     );
   };
 
-  const styles = createDeviceStyles(colors);
+  const styles = useMemo(() => createDeviceStyles(colors), [colors]);
 
   return (
     <SafeAreaView style={styles.container} edges={['top']}>
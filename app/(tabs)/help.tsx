@@ -2,7 +2,7 @@ import { useBluetooth } from '@/contexts/bluetooth-context';
 import { useTheme } from '@/contexts/theme-context';
 import { createHelpStyles } from '@/styles/help.styles';
 import { Ionicons } from '@expo/vector-icons';
-import { useState } from 'react';
+import { useMemo, useState } from 'react';
 import { ActivityIndicator, FlatList, KeyboardAvoidingView, Platform, Text, TextInput, TouchableOpacity, View } from 'react-native';
 import { SafeAreaView } from 'react-native-safe-area-context';
 
@@ -82,7 +82,7 @@ export default function HelpScreen() {
     }
   };
 
-  const styles = createHelpStyles(colors);
+  const styles = useMemo(() => createHelpStyles(colors), [colors]);
 
   const renderMessage = ({ item }: { item: Message }) => (
     <View style={[styles.messageBubble, item.isUser ? styles.userBubble : styles.botBubble]}>
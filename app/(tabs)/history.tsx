@@ -5,7 +5,7 @@ import { createHistoryStyles } from '@/styles/history.styles';
 import { generateHistoryReport, shareReport } from '@/utils/report-generator';
 import { supabase } from '@/utils/supabase';
 import { Ionicons } from '@expo/vector-icons';
-import { useEffect, useState } from 'react';
+import { useEffect, useMemo, useState } from 'react';
 import { ActivityIndicator, Alert, Dimensions, Modal, ScrollView, Text, TouchableOpacity, View } from 'react-native';
 import { SafeAreaView } from 'react-native-safe-area-context';
 import Svg, { Circle, Line, Path } from 'react-native-svg';
@@ -17,6 +17,7 @@ const CHART_PADDING_BOTTOM = 30;
 const CHART_PADDING_LEFT = 35;
 const CHART_PADDING_RIGHT = 15;
 const MIN_POINT_SPACING = 50; // Minimum space between data points
+const HISTORY_COLUMNS = 'id, created_at, latitude, longitude, nitrogen, phosphorus, potassium, ph, moisture, temperature';
 
 interface SensorReading {
   id: string;
@@ -30,7 +31,6 @@ interface SensorReading {
   pH?: number;
   moisture: number;
   temperature: number;
-  user_id: string;
 }
 
 interface DailyAverage {
@@ -63,6 +63,7 @@ export default function HistoryScreen() {
   const { colors } = useTheme();
   const { user } = useAuth();
   const [readings, setReadings] = useState<SensorReading[]>([]);
+  const [readingsByDate, setReadingsByDate] = useState<Map<string, SensorReading[]>>(new Map());
   const [dailyAverages, setDailyAverages] = useState<DailyAverage[]>([]);
   const [datesWithData, setDatesWithData] = useState<Set<string>>(new Set());
   const [selectedDate, setSelectedDate] = useState<string | null>(null);
@@ -73,10 +74,10 @@ export default function HistoryScreen() {
   const [selectedMetric, setSelectedMetric] = useState<keyof DailyAverage>('nitrogen');
   const [currentMonth, setCurrentMonth] = useState(new Date());
 
-  const styles = createHistoryStyles(colors);
-  const calendarStyles = createCalendarStyles(colors);
+  const styles = useMemo(() => createHistoryStyles(colors), [colors]);
+  const calendarStyles = useMemo(() => createCalendarStyles(colors), [colors]);
 
-  const calculateDailyAverages = (data: SensorReading[]): DailyAverage[] => {
+  const groupReadingsByDate = (data: SensorReading[]): Map<string, SensorReading[]> => {
     const dailyMap = new Map<string, SensorReading[]>();
 
     data.forEach(reading => {
@@ -85,20 +86,33 @@ export default function HistoryScreen() {
       dailyMap.get(date)!.push(reading);
     });
 
+    return dailyMap;
+  };
+
+  const calculateDailyAverages = (dailyMap: Map<string, SensorReading[]>): DailyAverage[] => {
     const averages: DailyAverage[] = [];
     dailyMap.forEach((readings, date) => {
-      const sum = (key: keyof SensorReading) => 
-        readings.reduce((s, r) => s + (Number(r[key] || (key === 'ph' ? r.pH : 0)) || 0), 0);
-      
+      // Accumulate every metric in a single pass over the day's readings
+      let nitrogen = 0, phosphorus = 0, potassium = 0, ph = 0, moisture = 0, temperature = 0;
+      readings.forEach(r => {
+        nitrogen += Number(r.nitrogen) || 0;
+        phosphorus += Number(r.phosphorus) || 0;
+        potassium += Number(r.potassium) || 0;
+        ph += Number(r.ph || r.pH) || 0;
+        moisture += Number(r.moisture) || 0;
+        temperature += Number(r.temperature) || 0;
+      });
+
+      const count = readings.length;
       averages.push({
         date,
-        nitrogen: sum('nitrogen') / readings.length,
-        phosphorus: sum('phosphorus') / readings.length,
-        potassium: sum('potassium') / readings.length,
-        ph: sum('ph') / readings.length,
-        moisture: sum('moisture') / readings.length,
-        temperature: sum('temperature') / readings.length,
-        count: readings.length,
+        nitrogen: nitrogen / count,
+        phosphorus: phosphorus / count,
+        potassium: potassium / count,
+        ph: ph / count,
+        moisture: moisture / count,
+        temperature: temperature / count,
+        count,
       });
     });
 
@@ -114,7 +128,7 @@ export default function HistoryScreen() {
 
     const { data, error } = await supabase
       .from('sensor_readings')
-      .select('*')
+      .select(HISTORY_COLUMNS)
       .eq('user_id', user.uid)
       .gte('created_at', thirtyDaysAgo.toISOString())
       .order('created_at', { ascending: true });
@@ -122,8 +136,10 @@ export default function HistoryScreen() {
     if (error) {
       Alert.alert('Error', 'Failed to fetch history');
     } else {
+      const dailyMap = groupReadingsByDate(data || []);
       setReadings(data || []);
-      const averages = calculateDailyAverages(data || []);
+      setReadingsByDate(dailyMap);
+      const averages = calculateDailyAverages(dailyMap);
       setDailyAverages(averages);
       setDatesWithData(new Set(averages.map(avg => avg.date)));
     }
@@ -179,9 +195,7 @@ export default function HistoryScreen() {
     if (!datesWithData.has(date)) return;
 
     setSelectedDate(date);
-    const dayReadings = readings.filter(r => 
-      new Date(r.created_at).toISOString().split('T')[0] === date
-    );
+    const dayReadings = readingsByDate.get(date) ?? [];
 
     setDateReadings(dayReadings.map(r => ({
       time: new Date(r.created_at).toLocaleTimeString('en-US', { 
@@ -206,10 +220,17 @@ export default function HistoryScreen() {
       chartHeight: CHART_HEIGHT,
     };
 
-    const values = dailyAverages.map(avg => avg[selectedMetric as keyof DailyAverage] as number);
-    const dates = dailyAverages.map(avg => avg.date);
-    const minValue = Math.min(...values);
-    const maxValue = Math.max(...values);
+    const values: number[] = [];
+    const dates: string[] = [];
+    let minValue = Infinity;
+    let maxValue = -Infinity;
+    for (const avg of dailyAverages) {
+      const value = avg[selectedMetric as keyof DailyAverage] as number;
+      values.push(value);
+      dates.push(avg.date);
+      if (value < minValue) minValue = value;
+      if (value > maxValue) maxValue = value;
+    }
     const range = maxValue - minValue || 1;
 
     // Calculate dynamic width based on number of points (minimum spacing between points)
@@ -221,21 +242,15 @@ export default function HistoryScreen() {
     const chartHeight = CHART_HEIGHT - CHART_PADDING_TOP - CHART_PADDING_BOTTOM;
     const stepX = (dynamicChartWidth - CHART_PADDING_LEFT - CHART_PADDING_RIGHT) / Math.max(values.length - 1, 1);
 
-    const points = values.map((value, index) => {
-      const x = CHART_PADDING_LEFT + index * stepX;
-      const y = CHART_PADDING_TOP + chartHeight - ((value - minValue) / range * chartHeight);
-      return `${x},${y}`;
-    });
-
-    // Generate circle points for data markers
+    // Generate circle points for data markers; the line path reuses the same coordinates
     const circles = values.map((value, index) => {
       const x = CHART_PADDING_LEFT + index * stepX;
       const y = CHART_PADDING_TOP + chartHeight - ((value - minValue) / range * chartHeight);
       return { x, y, value };
     });
 
-    return { 
-      path: `M ${points.join(' L ')}`,
+    return {
+      path: `M ${circles.map(point => `${point.x},${point.y}`).join(' L ')}`,
       circles,
       minValue: minValue.toFixed(1),
       maxValue: maxValue.toFixed(1),
@@ -4,7 +4,7 @@ import { createHomeStyles } from '@/styles/home.styles';
 import { supabase } from '@/utils/supabase';
 import { Ionicons } from '@expo/vector-icons';
 import { router } from 'expo-router';
-import { useEffect, useState } from 'react';
+import { useEffect, useMemo, useState } from 'react';
 import { Text, TouchableOpacity, View } from 'react-native';
 import { SafeAreaView } from 'react-native-safe-area-context';
 
@@ -14,6 +14,60 @@ interface QuickStats {
   lastSync: string;
 }
 
+const MENU_ITEMS = [
+  {
+    id: 'present',
+    title: 'Present',
+    subtitle: 'Live Data',
+    icon: 'radio',
+    route: '/(tabs)/present',
+    gradient: ['#4ade80', '#22c55e'],
+    iconBg: '#dcfce7',
+  },
+  {
+    id: 'history',
+    title: 'History',
+    subtitle: 'Data & Trends',
+    icon: 'analytics',
+    route: '/(tabs)/history',
+    gradient: ['#60a5fa', '#3b82f6'],
+    iconBg: '#dbeafe',
+  },
+  {
+    id: 'map',
+    title: 'Map',
+    subtitle: 'Daily Tracking',
+    icon: 'map',
+    route: '/(tabs)/map',
+    gradient: ['#f87171', '#ef4444'],
+    iconBg: '#fee2e2',
+  },
+  {
+    id: 'recommendation',
+    title: 'Recommend',
+    subtitle: 'Fertilizer Rx',
+    icon: 'leaf',
+    route: '/(tabs)/recommendation',
+    gradient: ['#facc15', '#eab308'],
+    iconBg: '#fef9c3',
+  },
+];
+
+const formatLastSync = (isoString: string) => {
+  const date = new Date(isoString);
+  const now = new Date();
+  const diffMs = now.getTime() - date.getTime();
+  const diffMins = Math.floor(diffMs / 60000);
+  const diffHours = Math.floor(diffMs / 3600000);
+  const diffDays = Math.floor(diffMs / 86400000);
+
+  if (diffMins < 1) return 'Just now';
+  if (diffMins < 60) return `${diffMins}m ago`;
+  if (diffHours < 24) return `${diffHours}h ago`;
+  if (diffDays < 7) return `${diffDays}d ago`;
+  return date.toLocaleDateString('en-US', { month: 'short', day: 'numeric' });
+};
+
 export default function HomeScreen() {
   const { user } = useAuth();
   const { colors, theme } = useTheme();
@@ -23,46 +77,7 @@ export default function HomeScreen() {
     lastSync: '--',
   });
 
-  const menuItems = [
-    {
-      id: 'present',
-      title: 'Present',
-      subtitle: 'Live Data',
-      icon: 'radio',
-      route: '/(tabs)/present',
-      gradient: ['#4ade80', '#22c55e'],
-      iconBg: '#dcfce7',
-    },
-    {
-      id: 'history',
-      title: 'History',
-      subtitle: 'Data & Trends',
-      icon: 'analytics',
-      route: '/(tabs)/history',
-      gradient: ['#60a5fa', '#3b82f6'],
-      iconBg: '#dbeafe',
-    },
-    {
-      id: 'map',
-      title: 'Map',
-      subtitle: 'Daily Tracking',
-      icon: 'map',
-      route: '/(tabs)/map',
-      gradient: ['#f87171', '#ef4444'],
-      iconBg: '#fee2e2',
-    },
-    {
-      id: 'recommendation',
-      title: 'Recommend',
-      subtitle: 'Fertilizer Rx',
-      icon: 'leaf',
-      route: '/(tabs)/recommendation',
-      gradient: ['#facc15', '#eab308'],
-      iconBg: '#fef9c3',
-    },
-  ];
-
-  const styles = createHomeStyles(colors, theme);
+  const styles = useMemo(() => createHomeStyles(colors, theme), [colors, theme]);
 
   // Fetch statistics from database
   useEffect(() => {
@@ -73,19 +88,33 @@ export default function HomeScreen() {
 
         const userId = (authUser as any)?.uid || (authUser as any)?.id;
 
-        // Get total readings count
-        const { count: readingsCount } = await supabase
-          .from('sensor_readings')
-          .select('*', { count: 'exact', head: true })
-          .eq('user_id', userId);
-
-        // Get unique locations count
-        const { data: locationsData } = await supabase
-          .from('sensor_readings')
-          .select('latitude, longitude')
-          .eq('user_id', userId)
-          .not('latitude', 'is', null)
-          .not('longitude', 'is', null);
+        // Count, locations and last sync are independent, so issue them together
+        const [
+          { count: readingsCount },
+          { data: locationsData },
+          { data: lastReading },
+        ] = await Promise.all([
+          // Get total readings count
+          supabase
+            .from('sensor_readings')
+            .select('*', { count: 'exact', head: true })
+            .eq('user_id', userId),
+          // Get unique locations count
+          supabase
+            .from('sensor_readings')
+            .select('latitude, longitude')
+            .eq('user_id', userId)
+            .not('latitude', 'is', null)
+            .not('longitude', 'is', null),
+          // Get last sync time
+          supabase
+            .from('sensor_readings')
+            .select('created_at')
+            .eq('user_id', userId)
+            .order('created_at', { ascending: false })
+            .limit(1)
+            .single(),
+        ]);
 
         // Count unique locations (round to 4 decimal places)
         const uniqueLocations = locationsData 
@@ -96,30 +125,6 @@ export default function HomeScreen() {
             ).size
           : 0;
 
-        // Get last sync time
-        const { data: lastReading } = await supabase
-          .from('sensor_readings')
-          .select('created_at')
-          .eq('user_id', userId)
-          .order('created_at', { ascending: false })
-          .limit(1)
-          .single();
-
-        const formatLastSync = (isoString: string) => {
-          const date = new Date(isoString);
-          const now = new Date();
-          const diffMs = now.getTime() - date.getTime();
-          const diffMins = Math.floor(diffMs / 60000);
-          const diffHours = Math.floor(diffMs / 3600000);
-          const diffDays = Math.floor(diffMs / 86400000);
-
-          if (diffMins < 1) return 'Just now';
-          if (diffMins < 60) return `${diffMins}m ago`;
-          if (diffHours < 24) return `${diffHours}h ago`;
-          if (diffDays < 7) return `${diffDays}d ago`;
-          return date.toLocaleDateString('en-US', { month: 'short', day: 'numeric' });
-        };
-
         setStats({
           totalReadings: readingsCount || 0,
           uniqueLocations: uniqueLocations,
@@ -191,7 +196,7 @@ export default function HomeScreen() {
         {/* Services Section */}
         <Text style={styles.servicesHeading}>Services</Text>
         <View style={styles.grid}>
-          {menuItems.map((item, index) => (
+          {MENU_ITEMS.map((item, index) => (
             <TouchableOpacity
               key={item.id}
               style={styles.card}
@@ -5,7 +5,7 @@ import { createMapStyles } from '@/styles/map.styles';
 import { supabase } from '@/utils/supabase';
 import { Ionicons } from '@expo/vector-icons';
 import * as Location from 'expo-location';
-import { useEffect, useState } from 'react';
+import { useEffect, useMemo, useState } from 'react';
 import { Alert, ScrollView, Text, TouchableOpacity, View } from 'react-native';
 import { SafeAreaView } from 'react-native-safe-area-context';
 
@@ -26,7 +26,7 @@ export default function MapScreen() {
   const [centerLocation, setCenterLocation] = useState<{ latitude: number; longitude: number } | null>(null);
   const [currentUserLocation, setCurrentUserLocation] = useState<{ latitude: number; longitude: number } | null>(null);
   const [locationPermission, setLocationPermission] = useState<boolean>(false);
-  const styles = createMapStyles(colors);
+  const styles = useMemo(() => createMapStyles(colors), [colors]);
 
   // Request location permissions and get current location
   const getCurrentLocation = async () => {
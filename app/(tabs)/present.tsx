@@ -5,7 +5,7 @@ import { createPresentStyles } from '@/styles/present.styles';
 import { supabase } from '@/utils/supabase';
 import { Ionicons } from '@expo/vector-icons';
 import { router } from 'expo-router';
-import { useEffect, useState } from 'react';
+import { useEffect, useMemo, useState } from 'react';
 import { ActivityIndicator, Modal, ScrollView, Text, TouchableOpacity, View } from 'react-native';
 import { SafeAreaView } from 'react-native-safe-area-context';
 import Svg, { Circle, Path, Text as SvgText } from 'react-native-svg';
@@ -30,6 +30,8 @@ interface SensorReading {
   humidity?: number;
 }
 
+const READING_COLUMNS = 'nitrogen, phosphorus, potassium, ph, moisture, temperature, humidity';
+
 export default function PresentScreen() {
   const { latestSensorData, isConnected, isDataValid } = useBluetooth();
   const { colors } = useTheme();
@@ -40,7 +42,7 @@ export default function PresentScreen() {
   const [selectedCropId, setSelectedCropId] = useState('general');
   const [showCropSelector, setShowCropSelector] = useState(false);
 
-  const styles = createPresentStyles(colors);
+  const styles = useMemo(() => createPresentStyles(colors), [colors]);
   const cropProfile = getCropProfileById(selectedCropId);
 
   // Fetch latest reading from Supabase
@@ -82,7 +84,7 @@ export default function PresentScreen() {
 
       const { data, error: dbError } = await supabase
         .from('sensor_readings')
-        .select('nitrogen, phosphorus, potassium, ph, moisture, temperature, humidity')
+        .select(READING_COLUMNS)
         .eq('user_id', user.id)
         .order('created_at', { ascending: false })
         .limit(1)
@@ -6,7 +6,7 @@ import { generateRecommendationReport, shareReport } from '@/utils/report-genera
 import { supabase } from '@/utils/supabase';
 import { pauseSpeaking, resumeSpeaking, speakPrescription, stopSpeaking } from '@/utils/voice';
 import { Ionicons } from '@expo/vector-icons';
-import { useEffect, useState } from 'react';
+import { useEffect, useMemo, useState } from 'react';
 import { ActivityIndicator, Alert, ScrollView, Text, TouchableOpacity, View } from 'react-native';
 import { SafeAreaView } from 'react-native-safe-area-context';
 
@@ -35,6 +35,8 @@ interface Recommendation {
   amount?: string;
 }
 
+const READING_COLUMNS = 'id, created_at, nitrogen, phosphorus, potassium, ph, moisture, temperature';
+
 const CROPS: Crop[] = [
   { id: 'paddy', name: 'Paddy', icon: '🌾', emoji: '🌾' },
   { id: 'cotton', name: 'Cotton', icon: '☁️', emoji: '☁️' },
@@ -47,7 +49,7 @@ const CROPS: Crop[] = [
 export default function RecommendationScreen() {
   const { colors } = useTheme();
   const { user } = useAuth();
-  const styles = createRecommendationStyles(colors);
+  const styles = useMemo(() => createRecommendationStyles(colors), [colors]);
   
   const [view, setView] = useState<'selection' | 'prescription'>('selection');
   const [selectedCrop, setSelectedCrop] = useState<Crop | null>(null);
@@ -81,7 +83,7 @@ export default function RecommendationScreen() {
     try {
       const { data, error } = await supabase
         .from('sensor_readings')
-        .select('*')
+        .select(READING_COLUMNS)
         .eq('user_id', user.uid)
         .order('created_at', { ascending: false })
         .limit(1)
@@ -4,7 +4,7 @@ import { createSettingsStyles } from '@/styles/settings.styles';
 import { supabase } from '@/utils/supabase';
 import { Ionicons } from '@expo/vector-icons';
 import { router } from 'expo-router';
-import { useEffect, useState } from 'react';
+import { useEffect, useMemo, useState } from 'react';
 import { ActivityIndicator, Alert, ScrollView, Switch, Text, TextInput, TouchableOpacity, View } from 'react-native';
 import { SafeAreaView } from 'react-native-safe-area-context';
 
@@ -183,7 +183,7 @@ export default function SettingsScreen() {
     );
   };
 
-  const styles = createSettingsStyles(colors);
+  const styles = useMemo(() => createSettingsStyles(colors), [colors]);
 
   return (
     <SafeAreaView style={styles.container} edges={['top']}>
@@ -2,6 +2,10 @@ import * as Print from 'expo-print';
 import * as Sharing from 'expo-sharing';
 import { supabase } from './supabase';
 
+// Limit history report rows to prevent memory issues
+const MAX_REPORT_READINGS = 100;
+const HISTORY_REPORT_COLUMNS = 'created_at, nitrogen, phosphorus, potassium, ph, moisture, temperature';
+
 interface SensorData {
   nitrogen?: number;
   phosphorus?: number;
@@ -87,15 +91,30 @@ const getHealthColor = (percentage: number): string => {
  * Generate HTML for History Report
  */
 const generateHistoryReportHTML = (data: SensorData[], dateRange: { start: string; end: string }): string => {
-  // Calculate averages
-  const avg = {
-    nitrogen: data.reduce((sum, d) => sum + (d.nitrogen || 0), 0) / data.length,
-    phosphorus: data.reduce((sum, d) => sum + (d.phosphorus || 0), 0) / data.length,
-    potassium: data.reduce((sum, d) => sum + (d.potassium || 0), 0) / data.length,
-    ph: data.reduce((sum, d) => sum + ((d.pH || d.ph) || 0), 0) / data.length,
-    moisture: data.reduce((sum, d) => sum + (d.moisture || 0), 0) / data.length,
-    temperature: data.reduce((sum, d) => sum + (d.temperature || 0), 0) / data.length,
-  };
+  // Calculate averages and temperature/moisture ranges (single pass over the readings)
+  const avg = { nitrogen: 0, phosphorus: 0, potassium: 0, ph: 0, moisture: 0, temperature: 0 };
+  let minTemperature = Infinity, maxTemperature = -Infinity;
+  let minMoisture = Infinity, maxMoisture = -Infinity;
+  for (const d of data) {
+    const temperature = d.temperature || 0;
+    const moisture = d.moisture || 0;
+    avg.nitrogen += d.nitrogen || 0;
+    avg.phosphorus += d.phosphorus || 0;
+    avg.potassium += d.potassium || 0;
+    avg.ph += (d.pH || d.ph) || 0;
+    avg.moisture += moisture;
+    avg.temperature += temperature;
+    if (temperature < minTemperature) minTemperature = temperature;
+    if (temperature > maxTemperature) maxTemperature = temperature;
+    if (moisture < minMoisture) minMoisture = moisture;
+    if (moisture > maxMoisture) maxMoisture = moisture;
+  }
+  avg.nitrogen /= data.length;
+  avg.phosphorus /= data.length;
+  avg.potassium /= data.length;
+  avg.ph /= data.length;
+  avg.moisture /= data.length;
+  avg.temperature /= data.length;
   
   const avgHealth = calculateHealthPercentage(avg as SensorData);
   const healthColor = getHealthColor(avgHealth);
@@ -213,10 +232,10 @@ const generateHistoryReportHTML = (data: SensorData[], dateRange: { start: strin
             <strong>📊 Data Collection:</strong> ${data.length} readings collected over the period.
           </div>
           <div class="recommendation-item">
-            <strong>🌡️ Temperature Range:</strong> ${Math.min(...data.map(d => d.temperature || 0)).toFixed(1)}°C - ${Math.max(...data.map(d => d.temperature || 0)).toFixed(1)}°C
+            <strong>🌡️ Temperature Range:</strong> ${minTemperature.toFixed(1)}°C - ${maxTemperature.toFixed(1)}°C
           </div>
           <div class="recommendation-item">
-            <strong>💧 Moisture Range:</strong> ${Math.min(...data.map(d => d.moisture || 0)).toFixed(1)}% - ${Math.max(...data.map(d => d.moisture || 0)).toFixed(1)}%
+            <strong>💧 Moisture Range:</strong> ${minMoisture.toFixed(1)}% - ${maxMoisture.toFixed(1)}%
           </div>
           <div class="recommendation-item">
             <strong>⚖️ pH Stability:</strong> Average pH is ${avg.ph.toFixed(2)} (${avg.ph < 6.0 ? 'Acidic' : avg.ph > 7.5 ? 'Alkaline' : 'Optimal'})
@@ -379,11 +398,12 @@ export const generateHistoryReport = async (options: HistoryReportOptions): Prom
     // Fetch data from database
     const { data, error } = await supabase
       .from('sensor_readings')
-      .select('*')
+      .select(HISTORY_REPORT_COLUMNS)
       .eq('user_id', userId)
       .gte('created_at', startDate.toISOString())
       .lte('created_at', endDate.toISOString())
-      .order('created_at', { ascending: true });
+      .order('created_at', { ascending: true })
+      .limit(MAX_REPORT_READINGS);
     
     if (error) {
       console.error('❌ Database error:', error);
@@ -394,11 +414,8 @@ export const generateHistoryReport = async (options: HistoryReportOptions): Prom
       throw new Error('No data available for the selected period');
     }
     
-    // Limit data to prevent memory issues
-    const limitedData = data.slice(0, 100);
-    
     // Generate HTML
-    const html = generateHistoryReportHTML(limitedData, {
+    const html = generateHistoryReportHTML(data, {
       start: startDate.toISOString(),
       end: endDate.toISOString(),
     });